@@ -1,12 +1,27 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.responses import ORJSONResponse
 from app.routes import health, stats, mood, discovery, patterns, milestones, sessions
+from app.services.data_loader import spotify_data
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load streaming data and serialize static payloads before serving requests"""
+    await asyncio.to_thread(spotify_data.load_data)
+    await asyncio.to_thread(spotify_data.warmup)
+    yield
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Spotify Stats API",
     description="API for Spotify streaming history analysis",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -0,0 +1,15 @@
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def precomputed_json(payload: bytes) -> Response:
+    """Return already-serialized JSON bytes without rendering them again"""
+    return Response(content=payload, media_type="application/json")
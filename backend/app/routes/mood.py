@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Query
+from typing import Literal
+from fastapi import APIRouter
+from app.responses import precomputed_json
 from app.services.data_loader import spotify_data
 
 router = APIRouter(prefix="/api/mood", tags=["mood"])
 
 
 @router.get("/summary")
-async def get_mood_summary(window: str = Query("30d", regex="^(7d|30d|90d|all)$")):
+def get_mood_summary(window: Literal["7d", "30d", "90d", "all"] = "30d"):
     """
     Get mood summary for a time window
 
@@ -15,32 +17,29 @@ async def get_mood_summary(window: str = Query("30d", regex="^(7d|30d|90d|all)$"
     Returns:
         Average valence, energy, and danceability for the period
     """
-    # Parse window
-    if window == "all":
-        window_days = 36500  # ~100 years
-    else:
-        window_days = int(window.rstrip('d'))
+    # Parse window; None means no date filter
+    window_days = None if window == "all" else int(window.rstrip('d'))
 
     return spotify_data.get_mood_summary(window_days=window_days)
 
 
 @router.get("/contexts")
-async def get_mood_contexts():
+def get_mood_contexts():
     """
     Get mood comparisons across different contexts
 
     Returns:
         Mood metrics for weekday vs weekend and by platform
     """
-    return spotify_data.get_mood_contexts()
+    return precomputed_json(spotify_data.get_payload("get_mood_contexts"))
 
 
 @router.get("/monthly")
-async def get_mood_monthly():
+def get_mood_monthly():
     """
     Get monthly mood trends over time
 
     Returns:
         List of monthly average mood metrics
     """
-    return spotify_data.get_mood_monthly()
+    return precomputed_json(spotify_data.get_payload("get_mood_monthly"))
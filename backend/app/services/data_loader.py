@@ -1,264 +1,746 @@
-import json
+import functools
+import heapq
+import math
+from array import array
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable, Iterator
 from datetime import datetime, timedelta
-from collections import defaultdict
+from fractions import Fraction
 import statistics
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score
+import orjson
+import pandas as pd
 
 # Path to data directory
 DATA_DIR = Path(__file__).parent.parent.parent.parent / 'data'
 
+# Parsed columns are cached here so restarts can skip JSON parsing
+COLUMN_CACHE_PATH = DATA_DIR / '.cache' / 'streaming_columns.npz'
+# Bump when the cached column layout changes
+COLUMN_CACHE_VERSION = 3
+
+# String fields interned as int32 codes plus a table of distinct names
+NAME_COLUMNS = ('track', 'artist', 'album', 'platform')
+
+# Weekend flag per weekday number (Monday=0 ... Saturday=5, Sunday=6)
+WEEKEND_DAYS = np.array([False, False, False, False, False, True, True])
+
+# Mood scores are stored as uint8 levels of 1/MOOD_SCALE; every rule step is a multiple of 0.05
+MOOD_SCALE = 200
+
+# Parameter-free getters whose responses are serialized once at startup
+PRECOMPUTED_GETTERS = (
+    'get_overview_stats',
+    'get_monthly_data',
+    'get_platform_stats',
+    'get_hourly_distribution',
+    'get_daily_distribution',
+    'get_yearly_comparison',
+    'get_listening_heatmap',
+    'get_monthly_diversity',
+    'get_weekend_weekday_comparison',
+    'get_session_durations',
+    'get_session_statistics',
+    'get_mood_contexts',
+    'get_mood_monthly',
+    'get_discovery_timeline',
+    'get_reflective_insights',
+    'get_milestones_list',
+)
+
+
+def _read_json(path: Path) -> List[Dict[str, Any]]:
+    """Parse one streaming history file"""
+    return orjson.loads(path.read_bytes())
+
+
+def _iter_records(files: List[Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield records one file at a time.
+
+    The next file is parsed in the background while the current one is
+    consumed, so at most two parsed files are alive at once.
+    """
+    if not files:
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(_read_json, files[0])
+        for next_path in files[1:] + [None]:
+            records = pending.result()
+            pending = executor.submit(_read_json, next_path) if next_path else None
+            yield from records
+
+
+def _intern(lookup: Dict[str, int], value: Optional[str]) -> int:
+    """Code for a name, assigning the next code on first appearance; -1 if missing"""
+    if not value:
+        return -1
+    code = lookup.get(value)
+    if code is None:
+        code = lookup[value] = len(lookup)
+    return code
+
+
+def _name_table(lookup: Dict[str, int]) -> np.ndarray:
+    """Distinct names indexed by their interned code"""
+    names = np.empty(len(lookup), dtype=object)
+    names[:] = list(lookup)
+    return names
+
+
+def _count_codes(codes: np.ndarray, n_names: int) -> np.ndarray:
+    """Occurrences of each interned code, ignoring missing values"""
+    return np.bincount(codes[codes >= 0], minlength=n_names)
+
+
+def _mean(values: List[float]) -> float:
+    """Arithmetic mean with an exactly rounded sum, without statistics.mean's Fraction overhead"""
+    return math.fsum(values) / len(values)
+
+
+def _tally_scores(group_idx: np.ndarray, n_groups: int, scores: np.ndarray) -> np.ndarray:
+    """
+    Count each quantized mood score per group with one bincount
+
+    Returns:
+        Counts of shape (n_groups, MOOD_SCALE + 1)
+    """
+    n_levels = MOOD_SCALE + 1
+    return np.bincount(
+        group_idx * n_levels + scores,
+        minlength=n_groups * n_levels
+    ).reshape(n_groups, n_levels)
+
+
+# Exact value of each quantized score level, as statistics.mean would see the float
+_MOOD_LEVELS = [Fraction(level / MOOD_SCALE) for level in range(MOOD_SCALE + 1)]
+
+
+def _mood_averages_from_tallies(tallies: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Average mood scores per group from per-level tallies.
+
+    Each group's total is summed as Fractions over the levels that occur,
+    so the means round exactly like statistics.mean over the float scores.
+
+    Args:
+        tallies: avg_* metric name -> counts per group and score level
+
+    Returns:
+        Average valence, energy, danceability and sample size per group
+    """
+    # Every metric covers the same streams, so any one gives the group sizes
+    sample_sizes = next(iter(tallies.values())).sum(axis=1).tolist()
+
+    means = {}
+    for metric, counts in tallies.items():
+        group_means = []
+        for group_counts, size in zip(counts.tolist(), sample_sizes):
+            if not size:
+                group_means.append(None)
+                continue
+            total = sum(_MOOD_LEVELS[level] * count for level, count in enumerate(group_counts) if count)
+            group_means.append(round(float(total / size), 3))
+        means[metric] = group_means
+
+    return [
+        {**{metric: values[group] for metric, values in means.items()}, 'sample_size': size}
+        for group, size in enumerate(sample_sizes)
+    ]
+
+
+def _memoized(method: Callable) -> Callable:
+    """
+    Cache a getter's result per call arguments until the next data load.
+
+    Keys include the data version, so a result still being computed from
+    replaced data is never served. Cached results are shared between
+    callers and must be treated as read-only.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (self._data_version, method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = method(self, *args, **kwargs)
+            self._cache[key] = result
+            return result
+
+    return wrapper
+
 
 class SpotifyDataLoader:
     """Service to load and process Spotify streaming data"""
 
     def __init__(self):
-        self._data: List[Dict[str, Any]] = []
+        self._audio_files: List[Path] = []
         self._loaded = False
+        self._load_lock = threading.Lock()
+        self._cluster_lock = threading.Lock()
+        self._data_version = 0
+        self._cache: Dict[Tuple, Any] = {}
+        self._payloads: Dict[Tuple[int, str], bytes] = {}
+
+        # Columnar (structure-of-arrays) view of the streaming records
+        self._ts = np.empty(0, dtype='datetime64[s]')
+        self._ms_played = np.empty(0, dtype=np.int64)
+        self._skipped = np.empty(0, dtype=bool)
+        for name in NAME_COLUMNS:
+            setattr(self, f'_{name}_codes', np.empty(0, dtype=np.int32))
+            setattr(self, f'_{name}_names', np.empty(0, dtype=object))
+
+        # Calendar fields derived from the timestamps at load time
+        self._hour = np.empty(0, dtype=np.uint8)
+        self._weekday = np.empty(0, dtype=np.uint8)
+        self._month = np.empty(0, dtype='datetime64[M]')
+        self._year = np.empty(0, dtype=np.int16)
+        self._day = np.empty(0, dtype='datetime64[D]')
+
+        # Per-stream mood scores derived from the columns above
+        self._valence = np.empty(0, dtype=np.uint8)
+        self._energy = np.empty(0, dtype=np.uint8)
+        self._danceability = np.empty(0, dtype=np.uint8)
 
     def load_data(self) -> None:
         """Load all audio streaming JSON files"""
         if self._loaded:
             return
 
-        # Load audio streaming files (exclude video)
-        audio_files = sorted(DATA_DIR.glob('streaming_[0-9]*.json'))
+        # Route handlers run on a thread pool; only the first caller loads
+        with self._load_lock:
+            if self._loaded:
+                return
+
+            # Load audio streaming files (exclude video)
+            self._audio_files = sorted(DATA_DIR.glob('streaming_[0-9]*.json'))
+
+            if self._load_column_cache():
+                source = 'column cache'
+            else:
+                # Stream straight into the columns; records are not kept
+                self._build_columns(_iter_records(self._audio_files))
+                self._save_column_cache()
+                source = f"{len(self._audio_files)} files"
+
+            self._data_version += 1
+            self._cache.clear()
+            self._payloads.clear()
+            self._loaded = True
+            print(f"✅ Loaded {len(self._ts)} streaming records from {source}")
+
+    def invalidate(self) -> None:
+        """Drop cached results so the next call reloads the streaming files"""
+        with self._load_lock:
+            self._loaded = False
+            self._data_version += 1
+            self._cache.clear()
+            self._payloads.clear()
+
+    def warmup(self) -> None:
+        """Serialize PRECOMPUTED_GETTERS payloads and build ranking tables ahead of the first request"""
+        for name in PRECOMPUTED_GETTERS:
+            # A failing getter is left to fail on its own route, not at startup
+            try:
+                self.get_payload(name)
+            except Exception as e:
+                print(f"⚠️ Could not precompute {name}: {e!r}")
+
+        # Full rankings back the parameterized endpoints
+        self._name_ranking('artist')
+        self._track_ranking()
+
+    def get_payload(self, name: str) -> bytes:
+        """
+        JSON body for a parameter-free getter, serialized on first use
+
+        Args:
+            name: Getter method name from PRECOMPUTED_GETTERS
+
+        Returns:
+            orjson-encoded response bytes
+        """
+        key = (self._data_version, name)
+        payload = self._payloads.get(key)
+        if payload is None:
+            payload = orjson.dumps(getattr(self, name)(), option=orjson.OPT_SERIALIZE_NUMPY)
+            self._payloads[key] = payload
+        return payload
+
+    def _load_column_cache(self) -> bool:
+        """
+        Restore the columns from COLUMN_CACHE_PATH.
+
+        The cache is only used when it has the current COLUMN_CACHE_VERSION
+        and was built from source files with the same names, sizes and
+        modification times. An unreadable cache is deleted so the rebuild
+        can replace it.
+
+        Returns:
+            True if the cache was valid and loaded
+        """
+        if not self._audio_files or not COLUMN_CACHE_PATH.exists():
+            return False
+
+        try:
+            with np.load(COLUMN_CACHE_PATH, allow_pickle=False) as cached:
+                if 'version' not in cached or int(cached['version']) != COLUMN_CACHE_VERSION:
+                    return False
+                if cached['sources'].tolist() != [f.name for f in self._audio_files]:
+                    return False
+                if not np.array_equal(cached['source_stats'], self._source_stats()):
+                    return False
+
+                # Read every column before assigning any, so a bad file leaves no partial state
+                ts = cached['ts']
+                ms_played = cached['ms_played']
+                skipped = cached['skipped']
+                names = {
+                    name: (cached[f'{name}_codes'], cached[f'{name}_names'].astype(object))
+                    for name in NAME_COLUMNS
+                }
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            print(f"⚠️ Ignoring unreadable column cache: {e!r}")
+            COLUMN_CACHE_PATH.unlink(missing_ok=True)
+            return False
+
+        self._ts = ts
+        self._ms_played = ms_played
+        self._skipped = skipped
+        for name, (codes, table) in names.items():
+            setattr(self, f'_{name}_codes', codes)
+            setattr(self, f'_{name}_names', table)
+
+        self._derive_calendar_columns()
+        self._derive_mood_columns()
+        return True
+
+    def _source_stats(self) -> np.ndarray:
+        """(size, mtime in ns) of each source file, used to fingerprint the cache"""
+        stats = [f.stat() for f in self._audio_files]
+        return np.array([(st.st_size, st.st_mtime_ns) for st in stats], dtype=np.int64)
+
+    def _save_column_cache(self) -> None:
+        """Write the columns to COLUMN_CACHE_PATH for the next start"""
+        columns = {
+            'version': np.array(COLUMN_CACHE_VERSION),
+            'sources': np.array([f.name for f in self._audio_files], dtype=str),
+            'source_stats': self._source_stats(),
+            'ts': self._ts,
+            'ms_played': self._ms_played,
+            'skipped': self._skipped,
+        }
+        for name in NAME_COLUMNS:
+            columns[f'{name}_codes'] = getattr(self, f'_{name}_codes')
+            columns[f'{name}_names'] = getattr(self, f'_{name}_names').astype(str)
+
+        tmp_path = COLUMN_CACHE_PATH.with_name(COLUMN_CACHE_PATH.stem + '.tmp.npz')
+        try:
+            COLUMN_CACHE_PATH.parent.mkdir(exist_ok=True)
+            np.savez(tmp_path, **columns)
+            os.replace(tmp_path, COLUMN_CACHE_PATH)
+        except OSError as e:
+            print(f"⚠️ Could not write column cache: {e}")
+
+    def _build_columns(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Project records into one array per field.
+
+        Timestamps are stored as naive UTC datetime64[s]. Names are interned
+        while reading, so each distinct string is kept once and empty names
+        get code -1. Records without a timestamp are skipped since they
+        cannot be placed in time.
+        """
+        ts = []
+        ms_played = array('q')
+        skipped = bytearray()
+        track_ids, artist_ids, album_ids, platform_ids = {}, {}, {}, {}
+        tracks, artists, albums, platforms = array('i'), array('i'), array('i'), array('i')
+
+        for record in records:
+            raw_ts = record.get('ts')
+            if not raw_ts:
+                continue
+
+            ts.append(raw_ts.rstrip('Z'))
+            ms_played.append(record.get('ms_played') or 0)
+            skipped.append(1 if record.get('skipped') else 0)
+            tracks.append(_intern(track_ids, record.get('master_metadata_track_name')))
+            artists.append(_intern(artist_ids, record.get('master_metadata_album_artist_name')))
+            albums.append(_intern(album_ids, record.get('master_metadata_album_album_name')))
+            platforms.append(_intern(platform_ids, record.get('platform')))
+
+        self._ts = np.array(ts, dtype='datetime64[s]')
+        self._ms_played = np.frombuffer(ms_played, dtype=np.int64).copy()
+        self._skipped = np.frombuffer(skipped, dtype=bool).copy()
+        self._track_codes, self._track_names = np.array(tracks, dtype=np.int32), _name_table(track_ids)
+        self._artist_codes, self._artist_names = np.array(artists, dtype=np.int32), _name_table(artist_ids)
+        self._album_codes, self._album_names = np.array(albums, dtype=np.int32), _name_table(album_ids)
+        self._platform_codes, self._platform_names = np.array(platforms, dtype=np.int32), _name_table(platform_ids)
+
+        self._derive_calendar_columns()
+        self._derive_mood_columns()
+
+    def _derive_calendar_columns(self) -> None:
+        """Compute day, hour, weekday, month and year arrays from the timestamps"""
+        seconds = self._ts.astype(np.int64)
+        self._day = self._ts.astype('datetime64[D]')
+        self._hour = (seconds // 3600 % 24).astype(np.uint8)
+        # 1970-01-01 was a Thursday (weekday 3)
+        self._weekday = ((seconds // 86400 + 3) % 7).astype(np.uint8)
+        self._month = self._ts.astype('datetime64[M]')
+        self._year = (self._month.astype(np.int64) // 12 + 1970).astype(np.int16)
+
+    def _derive_mood_columns(self) -> None:
+        """
+        Score valence, energy and danceability (0-1 scale) for every stream
+        from listening context and behavior.
+
+        Each score depends on at most two small discrete inputs, so every
+        combination is scored once into a lookup table and the per-stream
+        columns are a single gather from it.
+        """
+        hour = np.arange(24)
+        is_weekend = WEEKEND_DAYS[:, np.newaxis]  # One row per weekday
+
+        # Valence (happiness): Based on time of day and day of week
+        # Higher on weekends and during daytime (10am-8pm)
+        valence = np.where(is_weekend, 0.5 + 0.15, 0.5) + np.select(
+            [(hour >= 10) & (hour <= 20), ((hour >= 6) & (hour < 10)) | ((hour > 20) & (hour <= 23))],
+            [0.15, 0.05],
+            -0.10  # Late night/early morning
+        )
+
+        # Energy: Based on time of day and listening intensity
+        # Higher in morning/afternoon, lower at night
+        energy = 0.5 + np.select(
+            [(hour >= 6) & (hour <= 12), (hour > 12) & (hour <= 18), (hour > 18) & (hour <= 22)],
+            [0.25, 0.15, 0.05],  # Morning, afternoon, evening
+            -0.15  # Night/early morning
+        )
 
-        all_data = []
-        for file in audio_files:
-            with open(file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                all_data.extend(data)
+        # Danceability: Based on skip behavior and play duration
+        # Higher for tracks played longer (not skipped); columns are
+        # < 1 minute (probably skipped), 1-3 minutes, 3+ minutes (full listen)
+        danceability = 0.5 + np.array([-0.15, 0.10, 0.25])
+        danceability = np.stack([danceability, danceability - 0.20])
+
+        # Clamp values to 0-1 range and quantize to MOOD_SCALE levels
+        valence = np.rint(np.clip(valence, 0.0, 1.0) * MOOD_SCALE).astype(np.uint8)
+        energy = np.rint(np.clip(energy, 0.0, 1.0) * MOOD_SCALE).astype(np.uint8)
+        danceability = np.rint(np.clip(danceability, 0.0, 1.0) * MOOD_SCALE).astype(np.uint8)
+
+        play_length = np.searchsorted([60000, 180000], self._ms_played, side='right')
+        self._valence = valence[self._weekday, self._hour]
+        self._energy = energy[self._hour]
+        self._danceability = danceability[self._skipped.astype(np.intp), play_length]
+
+    @_memoized
+    def _chronological_order(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Row indices sorted by timestamp, equal timestamps kept in file order
+
+        Returns:
+            (row order, timestamps in that order)
+        """
+        order = np.argsort(self._ts, kind='stable')
+        return order, self._ts[order]
+
+    @_memoized
+    def _month_groups(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distinct months and each stream's index into them
 
-        self._data = all_data
-        self._loaded = True
-        print(f"✅ Loaded {len(self._data)} streaming records from {len(audio_files)} files")
+        Returns:
+            (sorted months, month index per stream)
+        """
+        return np.unique(self._month, return_inverse=True)
+
+    @_memoized
+    def _session_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split the chronological order into sessions at gaps of more than 30 minutes
+
+        Returns:
+            (start, stop) positions of each session in the chronological order,
+            stop exclusive
+        """
+        _, sorted_ts = self._chronological_order()
+        if not len(sorted_ts):
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+        breaks = np.flatnonzero(np.diff(sorted_ts.astype(np.int64)) > 30 * 60) + 1
+        starts = np.concatenate(([0], breaks))
+        stops = np.concatenate((breaks, [len(sorted_ts)]))
+        return starts, stops
+
+    @_memoized
+    def _day_runs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Distinct listening days grouped into runs of consecutive days
 
+        Returns:
+            (sorted days, streams per day, run starts, run stops) with run
+            positions indexing the sorted days, stops exclusive
+        """
+        days, daily_streams = np.unique(self._day, return_counts=True)
+        if not len(days):
+            return days, daily_streams, np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+        breaks = np.flatnonzero(np.diff(days).astype(np.int64) != 1) + 1
+        starts = np.concatenate(([0], breaks))
+        stops = np.concatenate((breaks, [len(days)]))
+        return days, daily_streams, starts, stops
+
+    @_memoized
     def get_overview_stats(self) -> Dict[str, Any]:
         """Get overview statistics"""
         if not self._loaded:
             self.load_data()
 
-        # Calculate basic stats
-        total_streams = len(self._data)
-        total_ms = sum(record.get('ms_played', 0) for record in self._data)
-        total_hours = total_ms / 3_600_000
-
-        unique_tracks = len(set(
-            record.get('master_metadata_track_name')
-            for record in self._data
-            if record.get('master_metadata_track_name')
-        ))
-
-        unique_artists = len(set(
-            record.get('master_metadata_album_artist_name')
-            for record in self._data
-            if record.get('master_metadata_album_artist_name')
-        ))
-
-        unique_albums = len(set(
-            record.get('master_metadata_album_album_name')
-            for record in self._data
-            if record.get('master_metadata_album_album_name')
-        ))
+        total_ms = int(self._ms_played.sum())
 
+        # Every interned name occurs at least once, so the tables are the distinct sets
         return {
-            'total_streams': total_streams,
-            'total_hours': round(total_hours, 2),
-            'unique_tracks': unique_tracks,
-            'unique_artists': unique_artists,
-            'unique_albums': unique_albums,
+            'total_streams': len(self._ms_played),
+            'total_hours': round(total_ms / 3_600_000, 2),
+            'unique_tracks': len(self._track_names),
+            'unique_artists': len(self._artist_names),
+            'unique_albums': len(self._album_names),
         }
 
+    @_memoized
+    def _name_ranking(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Every value of a NAME_COLUMNS column ranked by stream count,
+        ties in order of first appearance
+
+        Args:
+            name: Column name, e.g. 'artist' or 'platform'
+
+        Returns:
+            (codes, stream counts), highest first
+        """
+        codes = getattr(self, f'_{name}_codes')
+        counts = _count_codes(codes, len(getattr(self, f'_{name}_names')))
+        order = np.argsort(-counts, kind='stable')
+        return order, counts[order]
+
+    @_memoized
+    def _track_pairs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intern (track, artist) pairs for streams that have both names
+
+        Returns:
+            (row mask, pair id per masked row, packed track * n_artists + artist
+            key per pair id), ids in order of first appearance
+        """
+        present = (self._track_codes >= 0) & (self._artist_codes >= 0)
+        pair_keys = (
+            self._track_codes[present].astype(np.int64) * len(self._artist_names)
+            + self._artist_codes[present]
+        )
+        pair_idx, pairs = pd.factorize(pair_keys)
+        return present, pair_idx, pairs
+
+    @_memoized
+    def _track_ranking(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Every (track, artist) pair ranked by stream count, ties in order of first appearance
+
+        Returns:
+            (track codes, artist codes, stream counts), highest first
+        """
+        _, pair_idx, pairs = self._track_pairs()
+        counts = np.bincount(pair_idx, minlength=len(pairs))
+
+        order = np.argsort(-counts, kind='stable')
+        tracks, artists = np.divmod(pairs[order], len(self._artist_names))
+        return tracks, artists, counts[order]
+
+    @_memoized
     def get_top_artists(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top artists by stream count"""
         if not self._loaded:
             self.load_data()
 
-        artist_counts = defaultdict(int)
-        for record in self._data:
-            artist = record.get('master_metadata_album_artist_name')
-            if artist:
-                artist_counts[artist] += 1
-
-        # Sort and get top N
-        top_artists = sorted(
-            artist_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
+        artists, counts = self._name_ranking('artist')
 
         return [
-            {'artist': artist, 'streams': count}
-            for artist, count in top_artists
+            {'artist': self._artist_names[artist], 'streams': count}
+            for artist, count in zip(artists[:limit].tolist(), counts[:limit].tolist())
         ]
 
+    @_memoized
     def get_top_tracks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top tracks by stream count"""
         if not self._loaded:
             self.load_data()
 
-        track_counts = defaultdict(int)
-        for record in self._data:
-            track = record.get('master_metadata_track_name')
-            artist = record.get('master_metadata_album_artist_name')
-            if track and artist:
-                key = f"{track}|||{artist}"
-                track_counts[key] += 1
-
-        # Sort and get top N
-        top_tracks = sorted(
-            track_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
+        tracks, artists, counts = self._track_ranking()
 
         return [
             {
-                'track': key.split('|||')[0],
-                'artist': key.split('|||')[1],
+                'track': self._track_names[track],
+                'artist': self._artist_names[artist],
                 'streams': count
             }
-            for key, count in top_tracks
+            for track, artist, count in zip(
+                tracks[:limit].tolist(), artists[:limit].tolist(), counts[:limit].tolist()
+            )
         ]
 
+    @_memoized
     def get_monthly_data(self) -> List[Dict[str, Any]]:
         """Get monthly streaming statistics"""
         if not self._loaded:
             self.load_data()
 
-        monthly_stats = defaultdict(lambda: {'streams': 0, 'hours': 0})
-
-        for record in self._data:
-            ts = record.get('ts')
-            if ts:
-                # Parse timestamp
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                month_key = dt.strftime('%Y-%m')
+        months, month_idx = self._month_groups()
+        streams = np.bincount(month_idx, minlength=len(months))
+        ms_played = np.bincount(month_idx, weights=self._ms_played, minlength=len(months))
 
-                monthly_stats[month_key]['streams'] += 1
-                monthly_stats[month_key]['hours'] += record.get('ms_played', 0) / 3_600_000
-
-        # Convert to list and sort by month
-        result = [
+        return [
             {
                 'month': month,
-                'streams': data['streams'],
-                'hours': round(data['hours'], 2)
+                'streams': count,
+                'hours': round(ms / 3_600_000, 2)
             }
-            for month, data in sorted(monthly_stats.items())
+            for month, count, ms in zip(
+                np.datetime_as_string(months, unit='M').tolist(),
+                streams.tolist(),
+                ms_played.tolist(),
+            )
         ]
 
-        return result
-
+    @_memoized
     def get_platform_stats(self) -> List[Dict[str, Any]]:
         """Get platform usage statistics"""
         if not self._loaded:
             self.load_data()
 
-        platform_counts = defaultdict(int)
-        for record in self._data:
-            platform = record.get('platform')
-            if platform:
-                platform_counts[platform] += 1
-
-        # Sort by count
-        sorted_platforms = sorted(
-            platform_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        platforms, counts = self._name_ranking('platform')
 
         # Get top 10 and group rest as "Other"
-        top_10 = sorted_platforms[:10]
-        other_count = sum(count for _, count in sorted_platforms[10:])
-
         result = [
-            {'platform': platform, 'streams': count}
-            for platform, count in top_10
+            {'platform': self._platform_names[platform], 'streams': count}
+            for platform, count in zip(platforms[:10].tolist(), counts[:10].tolist())
         ]
 
+        other_count = int(counts[10:].sum())
         if other_count > 0:
             result.append({'platform': 'Other', 'streams': other_count})
 
         return result
 
-    def _calculate_mood_metrics(self, record: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    def _grouped_mood_averages(
+        self,
+        group_idx: np.ndarray,
+        n_groups: int,
+        rows: Any = slice(None)
+    ) -> List[Dict[str, Any]]:
         """
-        Calculate mood metrics from listening behavior patterns.
+        Average mood scores per group of streams in one pass
 
-        Returns valence, energy, and danceability scores (0-1 scale)
-        based on listening context and behavior.
+        Args:
+            group_idx: Group number (0..n_groups-1) of each selected stream
+            n_groups: Number of groups
+            rows: Mask or slice over the columns selecting the streams
+
+        Returns:
+            Average valence, energy, danceability and sample size per group
         """
-        ts = record.get('ts')
-        if not ts:
-            return {'valence': None, 'energy': None, 'danceability': None}
+        return _mood_averages_from_tallies({
+            'avg_valence': _tally_scores(group_idx, n_groups, self._valence[rows]),
+            'avg_energy': _tally_scores(group_idx, n_groups, self._energy[rows]),
+            'avg_danceability': _tally_scores(group_idx, n_groups, self._danceability[rows]),
+        })
 
-        dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-        hour = dt.hour
-        is_weekend = dt.weekday() >= 5
+    @_memoized
+    def _mood_platforms(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Platform labels and per-stream platform index for the mood rollup
 
-        # Valence (happiness): Based on time of day and day of week
-        # Higher on weekends and during daytime (10am-8pm)
-        valence = 0.5
-        if is_weekend:
-            valence += 0.15
-        if 10 <= hour <= 20:
-            valence += 0.15
-        elif 6 <= hour < 10 or 20 < hour <= 23:
-            valence += 0.05
-        else:  # Late night/early morning
-            valence -= 0.10
+        Streams without a platform are labelled 'unknown'. They share the index
+        of a literal 'unknown' platform when the data has one.
 
-        # Energy: Based on time of day and listening intensity
-        # Higher in morning/afternoon, lower at night
-        energy = 0.5
-        if 6 <= hour <= 12:  # Morning
-            energy += 0.25
-        elif 12 < hour <= 18:  # Afternoon
-            energy += 0.15
-        elif 18 < hour <= 22:  # Evening
-            energy += 0.05
-        else:  # Night/early morning
-            energy -= 0.15
+        Returns:
+            (platform label per index, platform index per stream)
+        """
+        labels = self._platform_names.tolist()
+        if 'unknown' in labels:
+            missing = labels.index('unknown')
+        else:
+            missing = len(labels)
+            labels.append('unknown')
 
-        # Danceability: Based on skip behavior and play duration
-        # Higher for tracks played longer (not skipped)
-        ms_played = record.get('ms_played', 0)
-        skipped = record.get('skipped', False)
-
-        danceability = 0.5
-        if ms_played >= 180000:  # 3+ minutes = full listen
-            danceability += 0.25
-        elif ms_played >= 60000:  # 1-3 minutes
-            danceability += 0.10
-        else:  # < 1 minute = probably skipped
-            danceability -= 0.15
-
-        if skipped:
-            danceability -= 0.20
-
-        # Clamp values to 0-1 range
-        valence = max(0.0, min(1.0, valence))
-        energy = max(0.0, min(1.0, energy))
-        danceability = max(0.0, min(1.0, danceability))
+        platform_idx = np.where(self._platform_codes < 0, missing, self._platform_codes)
+        return labels, platform_idx
 
-        return {
-            'valence': round(valence, 3),
-            'energy': round(energy, 3),
-            'danceability': round(danceability, 3)
-        }
+    @_memoized
+    def _mood_rollup(self) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Mood score tallies per (month, weekend, platform) cell, built in one pass
+
+        Platform indices follow the labels from _mood_platforms.
+
+        Returns:
+            (months, avg_* metric name -> counts of shape
+            (months, 2, platforms, score levels))
+        """
+        months, month_idx = self._month_groups()
+        platforms, platform_idx = self._mood_platforms()
+        n_platforms = len(platforms)
+        is_weekend = WEEKEND_DAYS[self._weekday]
+
+        cell_idx = (month_idx * 2 + is_weekend) * n_platforms + platform_idx
+        n_cells = len(months) * 2 * n_platforms
+
+        rollup = {}
+        for metric, scores in (
+            ('avg_valence', self._valence),
+            ('avg_energy', self._energy),
+            ('avg_danceability', self._danceability),
+        ):
+            counts = _tally_scores(cell_idx, n_cells, scores)
+            rollup[metric] = counts.reshape(len(months), 2, n_platforms, MOOD_SCALE + 1)
+
+        return months, rollup
+
+    def _rollup_averages(self, keep_axis: int) -> List[Dict[str, Any]]:
+        """Mood averages per index of one _mood_rollup axis (0 month, 1 weekend, 2 platform)"""
+        _, rollup = self._mood_rollup()
+        other_axes = tuple(axis for axis in range(3) if axis != keep_axis)
+
+        return _mood_averages_from_tallies({
+            metric: counts.sum(axis=other_axes)
+            for metric, counts in rollup.items()
+        })
+
+    def _mood_averages(self, rows: Any) -> Dict[str, Any]:
+        """
+        Average mood scores over a subset of streams
 
-    def get_mood_summary(self, window_days: int = 30) -> Dict[str, Any]:
+        Args:
+            rows: Boolean mask, row indices or slice selecting the streams
+
+        Returns:
+            Average valence, energy, danceability and sample size
+        """
+        group_idx = np.zeros(self._ts[rows].size, dtype=np.intp)
+        return self._grouped_mood_averages(group_idx, 1, rows)[0]
+
+    def get_mood_summary(self, window_days: Optional[int] = 30) -> Dict[str, Any]:
         """
         Get mood statistics for a time window based on listening patterns
 
         Args:
-            window_days: Number of days to look back (7, 30, 90, etc.)
+            window_days: Number of days to look back (7, 30, 90, etc.), or None for all history
 
         Returns:
             Average valence, energy, danceability and sample size
@@ -266,41 +748,37 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        # Use timezone-aware datetime to match data timestamps
+        if window_days is None:
+            return {'window_days': window_days, **self._recent_mood_averages(0)}
+
+        # Timestamps are stored as naive UTC
         from datetime import timezone
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=window_days)
+        cutoff_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=window_days)
 
-        valences = []
-        energies = []
-        danceabilities = []
+        # Binary-search the window start instead of comparing every timestamp
+        _, sorted_ts = self._chronological_order()
+        start = np.searchsorted(sorted_ts, np.datetime64(cutoff_date), side='left')
 
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
+        return {'window_days': window_days, **self._recent_mood_averages(int(start))}
 
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            if dt < cutoff_date:
-                continue
+    @_memoized
+    def _recent_mood_averages(self, start: int) -> Dict[str, Any]:
+        """
+        Average mood scores of the streams from a point in time onwards
 
-            # Calculate mood metrics from listening behavior
-            metrics = self._calculate_mood_metrics(record)
+        Keyed by position rather than cutoff so the result is reused until
+        the moving window actually drops a stream.
 
-            if metrics['valence'] is not None:
-                valences.append(metrics['valence'])
-            if metrics['energy'] is not None:
-                energies.append(metrics['energy'])
-            if metrics['danceability'] is not None:
-                danceabilities.append(metrics['danceability'])
+        Args:
+            start: Index into the chronological order of the first stream
 
-        return {
-            'window_days': window_days,
-            'avg_valence': round(statistics.mean(valences), 3) if valences else None,
-            'avg_energy': round(statistics.mean(energies), 3) if energies else None,
-            'avg_danceability': round(statistics.mean(danceabilities), 3) if danceabilities else None,
-            'sample_size': len(valences),
-        }
+        Returns:
+            Average valence, energy, danceability and sample size
+        """
+        order, _ = self._chronological_order()
+        return self._mood_averages(order[start:])
 
+    @_memoized
     def get_mood_contexts(self) -> Dict[str, Any]:
         """
         Compare mood metrics across different contexts based on listening patterns:
@@ -313,123 +791,39 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        weekday_moods = {'valence': [], 'energy': [], 'danceability': []}
-        weekend_moods = {'valence': [], 'energy': [], 'danceability': []}
-        platform_moods = defaultdict(lambda: {'valence': [], 'energy': [], 'danceability': []})
+        weekday, weekend = self._rollup_averages(keep_axis=1)
 
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
+        # Platforms in order of first appearance; streams without one are 'unknown'
+        platforms, _ = self._mood_platforms()
 
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            is_weekend = dt.weekday() >= 5  # Saturday=5, Sunday=6
-            platform = record.get('platform', 'unknown')
-
-            # Calculate mood metrics from listening behavior
-            metrics = self._calculate_mood_metrics(record)
-
-            valence = metrics['valence']
-            energy = metrics['energy']
-            danceability = metrics['danceability']
-
-            if valence is not None:
-                if is_weekend:
-                    weekend_moods['valence'].append(valence)
-                else:
-                    weekday_moods['valence'].append(valence)
-                platform_moods[platform]['valence'].append(valence)
-
-            if energy is not None:
-                if is_weekend:
-                    weekend_moods['energy'].append(energy)
-                else:
-                    weekday_moods['energy'].append(energy)
-                platform_moods[platform]['energy'].append(energy)
-
-            if danceability is not None:
-                if is_weekend:
-                    weekend_moods['danceability'].append(danceability)
-                else:
-                    weekday_moods['danceability'].append(danceability)
-                platform_moods[platform]['danceability'].append(danceability)
-
-        # Calculate averages
-        def avg_or_none(lst):
-            return round(statistics.mean(lst), 3) if lst else None
-
-        result = {
+        return {
             'weekday_vs_weekend': {
-                'weekday': {
-                    'avg_valence': avg_or_none(weekday_moods['valence']),
-                    'avg_energy': avg_or_none(weekday_moods['energy']),
-                    'avg_danceability': avg_or_none(weekday_moods['danceability']),
-                    'sample_size': len(weekday_moods['valence']),
-                },
-                'weekend': {
-                    'avg_valence': avg_or_none(weekend_moods['valence']),
-                    'avg_energy': avg_or_none(weekend_moods['energy']),
-                    'avg_danceability': avg_or_none(weekend_moods['danceability']),
-                    'sample_size': len(weekend_moods['valence']),
-                }
+                'weekday': weekday,
+                'weekend': weekend,
             },
             'by_platform': {
-                platform: {
-                    'avg_valence': avg_or_none(moods['valence']),
-                    'avg_energy': avg_or_none(moods['energy']),
-                    'avg_danceability': avg_or_none(moods['danceability']),
-                    'sample_size': len(moods['valence']),
-                }
-                for platform, moods in platform_moods.items()
-                if len(moods['valence']) >= 10  # Only include platforms with enough data
+                platform: moods
+                for platform, moods in zip(platforms, self._rollup_averages(keep_axis=2))
+                if moods['sample_size'] >= 10  # Only include platforms with enough data
             }
         }
 
-        return result
-
+    @_memoized
     def get_mood_monthly(self) -> List[Dict[str, Any]]:
         """Get monthly mood averages over time based on listening patterns"""
         if not self._loaded:
             self.load_data()
 
-        monthly_moods = defaultdict(lambda: {
-            'valence': [],
-            'energy': [],
-            'danceability': []
-        })
-
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            month_key = dt.strftime('%Y-%m')
-
-            # Calculate mood metrics from listening behavior
-            metrics = self._calculate_mood_metrics(record)
-
-            if metrics['valence'] is not None:
-                monthly_moods[month_key]['valence'].append(metrics['valence'])
-            if metrics['energy'] is not None:
-                monthly_moods[month_key]['energy'].append(metrics['energy'])
-            if metrics['danceability'] is not None:
-                monthly_moods[month_key]['danceability'].append(metrics['danceability'])
-
-        # Calculate monthly averages
-        result = []
-        for month in sorted(monthly_moods.keys()):
-            moods = monthly_moods[month]
-            result.append({
-                'month': month,
-                'avg_valence': round(statistics.mean(moods['valence']), 3) if moods['valence'] else None,
-                'avg_energy': round(statistics.mean(moods['energy']), 3) if moods['energy'] else None,
-                'avg_danceability': round(statistics.mean(moods['danceability']), 3) if moods['danceability'] else None,
-                'sample_size': len(moods['valence']),
-            })
+        months, _ = self._mood_rollup()
+        month_labels = np.datetime_as_string(months, unit='M').tolist()
+        averages = self._rollup_averages(keep_axis=0)
 
-        return result
+        return [
+            {'month': month, **month_averages}
+            for month, month_averages in zip(month_labels, averages)
+        ]
 
+    @_memoized
     def get_discovery_timeline(self) -> List[Dict[str, Any]]:
         """
         Get artist discovery timeline - when artists were first discovered
@@ -440,39 +834,28 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        # Track first appearance of each artist
-        artist_first_seen = {}
+        # First row in which each artist appears
+        present = np.flatnonzero(self._artist_codes >= 0)
+        _, first_seen = np.unique(self._artist_codes[present], return_index=True)
+        first_rows = present[first_seen]
 
-        for record in self._data:
-            ts = record.get('ts')
-            artist = record.get('master_metadata_album_artist_name')
-
-            if not ts or not artist:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-
-            # Track first time we saw this artist
-            if artist not in artist_first_seen:
-                artist_first_seen[artist] = dt
-
-        # Count discoveries by month
-        monthly_discoveries = defaultdict(int)
-        for artist, first_date in artist_first_seen.items():
-            month_key = first_date.strftime('%Y-%m')
-            monthly_discoveries[month_key] += 1
+        # Count discoveries by month; only the month labels are formatted
+        months, month_idx = self._month_groups()
+        monthly_discoveries = np.bincount(month_idx[first_rows], minlength=len(months))
+        month_labels = np.datetime_as_string(months, unit='M').tolist()
 
         # Convert to sorted list
         result = [
             {
-                'month': month,
-                'new_artists_count': count
+                'month': month_labels[i],
+                'new_artists_count': int(monthly_discoveries[i])
             }
-            for month, count in sorted(monthly_discoveries.items())
+            for i in np.flatnonzero(monthly_discoveries).tolist()
         ]
 
         return result
 
+    @_memoized
     def get_artist_loyalty(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Calculate artist loyalty metrics based on return probability and half-life
@@ -487,62 +870,44 @@ class SpotifyDataLoader:
             self.load_data()
 
         # Get top artists first
-        top_artists_data = self.get_top_artists(limit=limit * 2)  # Get more to filter
-        top_artists = {a['artist'] for a in top_artists_data[:limit]}
-
-        # Track listening sessions per artist
-        artist_sessions = defaultdict(list)
-
-        for record in self._data:
-            artist = record.get('master_metadata_album_artist_name')
-            ts = record.get('ts')
-
-            if not artist or not ts or artist not in top_artists:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            artist_sessions[artist].append(dt)
+        artists, _ = self._name_ranking('artist')
+        order, sorted_ts = self._chronological_order()
+        sorted_artists = self._artist_codes[order]
+        epochs = sorted_ts.astype(np.int64)
 
         # Calculate loyalty metrics
         results = []
-        for artist in top_artists:
-            if artist not in artist_sessions:
-                continue
-
-            sessions = sorted(artist_sessions[artist])
+        for artist in artists[:limit].tolist():
+            sessions = epochs[sorted_artists == artist]
             if len(sessions) < 5:  # Need minimum sessions to calculate
                 continue
 
-            # Calculate gaps between listens
-            gaps = []
-            for i in range(1, len(sessions)):
-                gap = (sessions[i] - sessions[i-1]).days
-                if gap > 0:  # Only count positive gaps
-                    gaps.append(gap)
+            # Calculate whole-day gaps between listens, only counting positive gaps
+            gaps = np.diff(sessions) // 86_400
+            gaps = gaps[gaps > 0].tolist()
 
             if not gaps:
                 continue
 
             # Return probability: inverse of average gap
             # Smaller gaps = higher return probability
-            avg_gap = statistics.mean(gaps)
+            avg_gap = _mean(gaps)
             return_prob = min(100.0, 100.0 / (1 + avg_gap))
 
             # Half-life: median gap (time until 50% likely to return)
             half_life = statistics.median(gaps)
 
             results.append({
-                'artist': artist,
+                'artist': self._artist_names[artist],
                 'return_prob': round(return_prob, 1),
                 'half_life_days': round(half_life, 1),
                 'total_streams': len(sessions)
             })
 
-        # Sort by return probability
-        results.sort(key=lambda x: x['return_prob'], reverse=True)
-
-        return results[:limit]
+        # Highest return probability first
+        return heapq.nlargest(limit, results, key=lambda x: x['return_prob'])
 
+    @_memoized
     def get_artist_obsessions(self, limit: int = 15) -> List[Dict[str, Any]]:
         """
         Identify obsession periods - when an artist dominated listening
@@ -556,50 +921,42 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        # Group streams by 7-day windows
-        window_days = 7
-        artist_by_window = defaultdict(lambda: defaultdict(int))
-        window_totals = defaultdict(int)
-
-        for record in self._data:
-            ts = record.get('ts')
-            artist = record.get('master_metadata_album_artist_name')
-
-            if not ts or not artist:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            # Create window key (week starting Monday)
-            week_start = dt - timedelta(days=dt.weekday())
-            window_key = week_start.strftime('%Y-%m-%d')
-
-            artist_by_window[window_key][artist] += 1
-            window_totals[window_key] += 1
-
-        # Find periods where artist dominated (>30% share)
-        obsessions = []
-        for window, artists in artist_by_window.items():
-            total = window_totals[window]
-            if total < 10:  # Skip windows with very few streams
-                continue
-
-            for artist, count in artists.items():
-                share = (count / total) * 100
-                if share >= 30.0:  # Obsession threshold
-                    window_date = datetime.strptime(window, '%Y-%m-%d')
-                    obsessions.append({
-                        'artist': artist,
-                        'period_start': window,
-                        'period_end': (window_date + timedelta(days=6)).strftime('%Y-%m-%d'),
-                        'period_share': round(share, 1),
-                        'streams_in_period': count
-                    })
-
-        # Sort by period share
-        obsessions.sort(key=lambda x: x['period_share'], reverse=True)
+        # Group streams by 7-day windows (week starting Monday)
+        present = self._artist_codes >= 0
+        n_artists = len(self._artist_names)
+        week_starts = (self._day - self._weekday.astype('timedelta64[D]'))[present]
+        week_idx, weeks = pd.factorize(week_starts.astype(np.int64))
+        weeks = weeks.astype('datetime64[D]')
+        window_totals = np.bincount(week_idx, minlength=len(weeks))
+
+        # Streams per (window, artist), pairs in order of first appearance
+        pair_idx, pairs = pd.factorize(week_idx.astype(np.int64) * n_artists + self._artist_codes[present])
+        pair_counts = np.bincount(pair_idx, minlength=len(pairs))
+        pair_weeks, pair_artists = np.divmod(pairs, n_artists)
+        pair_totals = window_totals[pair_weeks]
+        shares = pair_counts / pair_totals * 100
+
+        # Find periods where artist dominated (>30% share), skipping windows with very few streams
+        found = np.flatnonzero((pair_totals >= 10) & (shares >= 30.0))
+        found = found[np.argsort(pair_weeks[found], kind='stable')]  # Grouped by window
+
+        period_starts = np.datetime_as_string(weeks, unit='D').tolist()
+        period_ends = np.datetime_as_string(weeks + 6, unit='D').tolist()
+        obsessions = [
+            {
+                'artist': self._artist_names[pair_artists[i]],
+                'period_start': period_starts[pair_weeks[i]],
+                'period_end': period_ends[pair_weeks[i]],
+                'period_share': round(float(shares[i]), 1),
+                'streams_in_period': int(pair_counts[i])
+            }
+            for i in found.tolist()
+        ]
 
-        return obsessions[:limit]
+        # Highest period share first
+        return heapq.nlargest(limit, obsessions, key=lambda x: x['period_share'])
 
+    @_memoized
     def get_reflective_insights(self) -> Dict[str, Any]:
         """
         Generate reflective insights about listening patterns
@@ -611,56 +968,32 @@ class SpotifyDataLoader:
             self.load_data()
 
         # Calculate various insights
-        total_streams = len(self._data)
+        total_streams = len(self._ts)
+        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
-        # Time-based insights
-        hour_distribution = defaultdict(int)
-        weekday_distribution = defaultdict(int)
+        if total_streams:
+            # Find longest streak of consecutive listening days
+            sorted_dates, _, run_starts, run_stops = self._day_runs()
+            longest_streak = int((run_stops - run_starts).max())
 
-        # Streak calculations
-        daily_streams = defaultdict(int)
+            # Most active hour and day; ties go to whichever appears first
+            hour_idx, hours = pd.factorize(self._hour)
+            most_active_hour = int(hours[np.bincount(hour_idx).argmax()])
+            weekday_idx, weekdays = pd.factorize(self._weekday)
+            most_active_day = day_names[weekdays[np.bincount(weekday_idx).argmax()]]
 
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
+            # Top artist; podcast-only histories have no artist names
+            top_artists = self.get_top_artists(limit=1)
+            top_artist = top_artists[0]['artist'] if top_artists else 'Unknown'
 
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            hour_distribution[dt.hour] += 1
-            weekday_distribution[dt.weekday()] += 1
-            daily_streams[dt.date()] += 1
-
-        # Find longest streak
-        if daily_streams:
-            sorted_dates = sorted(daily_streams.keys())
-            current_streak = 1
-            longest_streak = 1
-
-            for i in range(1, len(sorted_dates)):
-                if (sorted_dates[i] - sorted_dates[i-1]).days == 1:
-                    current_streak += 1
-                    longest_streak = max(longest_streak, current_streak)
-                else:
-                    current_streak = 1
+            # Calculate average streams per day
+            date_range = int((sorted_dates[-1] - sorted_dates[0]).astype(np.int64)) + 1
+            avg_streams_per_day = total_streams / date_range
         else:
             longest_streak = 0
-
-        # Most active hour
-        most_active_hour = max(hour_distribution.items(), key=lambda x: x[1])[0] if hour_distribution else 0
-
-        # Most active day
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        most_active_day_idx = max(weekday_distribution.items(), key=lambda x: x[1])[0] if weekday_distribution else 0
-        most_active_day = day_names[most_active_day_idx]
-
-        # Top artist
-        top_artist = self.get_top_artists(limit=1)[0]['artist'] if self._data else 'Unknown'
-
-        # Calculate average streams per day
-        if daily_streams:
-            date_range = (max(daily_streams.keys()) - min(daily_streams.keys())).days + 1
-            avg_streams_per_day = total_streams / date_range if date_range > 0 else 0
-        else:
+            most_active_hour = 0
+            most_active_day = day_names[0]
+            top_artist = 'Unknown'
             avg_streams_per_day = 0
 
         return {
@@ -678,6 +1011,7 @@ class SpotifyDataLoader:
             ]
         }
 
+    @_memoized
     def get_hourly_distribution(self) -> List[Dict[str, Any]]:
         """
         Get listening distribution by hour of day (0-23)
@@ -688,24 +1022,17 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        hour_distribution = defaultdict(int)
-
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            hour_distribution[dt.hour] += 1
+        hour_distribution = np.bincount(self._hour, minlength=24)
 
         # Create list for all 24 hours (fill missing with 0)
         result = [
-            {'hour': hour, 'streams': hour_distribution.get(hour, 0)}
-            for hour in range(24)
+            {'hour': hour, 'streams': streams}
+            for hour, streams in enumerate(hour_distribution.tolist())
         ]
 
         return result
 
+    @_memoized
     def get_daily_distribution(self) -> List[Dict[str, Any]]:
         """
         Get listening distribution by day of week
@@ -716,25 +1043,18 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        day_distribution = defaultdict(int)
-
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            day_distribution[dt.weekday()] += 1
+        day_distribution = np.bincount(self._weekday, minlength=7)
 
         # Map to day names
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         result = [
-            {'day': day_names[day_idx], 'streams': day_distribution.get(day_idx, 0)}
-            for day_idx in range(7)
+            {'day': day_names[day_idx], 'streams': streams}
+            for day_idx, streams in enumerate(day_distribution.tolist())
         ]
 
         return result
 
+    @_memoized
     def get_skip_behavior(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Analyze skip behavior by artist
@@ -748,38 +1068,31 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        # Track streams and skips per artist
-        artist_stats = defaultdict(lambda: {'total': 0, 'skipped': 0})
+        # Track skips per artist; totals come from the ranking
+        present = self._artist_codes >= 0
+        skipped_counts = np.bincount(
+            self._artist_codes[present],
+            weights=self._skipped[present],
+            minlength=len(self._artist_names)
+        ).astype(np.int64)
 
-        for record in self._data:
-            artist = record.get('master_metadata_album_artist_name')
-            if not artist:
-                continue
-
-            skipped = record.get('skipped', False)
-            artist_stats[artist]['total'] += 1
-            if skipped:
-                artist_stats[artist]['skipped'] += 1
+        # Get top artists by total streams, then show their skip rates
+        artists, totals = self._name_ranking('artist')
+        enough = totals >= 5  # Need minimum streams for meaningful rate
 
-        # Calculate skip rates
         results = []
-        for artist, stats in artist_stats.items():
-            if stats['total'] < 5:  # Need minimum streams for meaningful rate
-                continue
-
-            skip_rate = (stats['skipped'] / stats['total']) * 100 if stats['total'] > 0 else 0
+        for artist, total in zip(artists[enough][:limit].tolist(), totals[enough][:limit].tolist()):
+            skipped = int(skipped_counts[artist])
             results.append({
-                'artist': artist,
-                'total_streams': stats['total'],
-                'skipped_count': stats['skipped'],
-                'skip_rate': round(skip_rate, 2)
+                'artist': self._artist_names[artist],
+                'total_streams': total,
+                'skipped_count': skipped,
+                'skip_rate': round((skipped / total) * 100, 2)
             })
 
-        # Get top artists by total streams, then show their skip rates
-        results.sort(key=lambda x: x['total_streams'], reverse=True)
-
-        return results[:limit]
+        return results
 
+    @_memoized
     def get_yearly_comparison(self) -> List[Dict[str, Any]]:
         """
         Get year-over-year listening comparison
@@ -790,31 +1103,23 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        yearly_stats = defaultdict(lambda: {'streams': 0, 'hours': 0})
-
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            year = dt.year
-
-            yearly_stats[year]['streams'] += 1
-            yearly_stats[year]['hours'] += record.get('ms_played', 0) / 3_600_000
+        years, year_idx = np.unique(self._year, return_inverse=True)
+        streams = np.bincount(year_idx, minlength=len(years))
+        ms_played = np.bincount(year_idx, weights=self._ms_played, minlength=len(years))
 
         # Convert to sorted list
         result = [
             {
                 'year': year,
-                'streams': data['streams'],
-                'hours': round(data['hours'], 2)
+                'streams': count,
+                'hours': round(ms / 3_600_000, 2)
             }
-            for year, data in sorted(yearly_stats.items())
+            for year, count, ms in zip(years.tolist(), streams.tolist(), ms_played.tolist())
         ]
 
         return result
 
+    @_memoized
     def get_session_durations(self) -> List[Dict[str, Any]]:
         """
         Get distribution of session durations (grouped listening periods)
@@ -827,66 +1132,27 @@ class SpotifyDataLoader:
             self.load_data()
 
         # Group streams into sessions (30min gap threshold)
-        sessions = []
-        current_session_start = None
-        current_session_end = None
-
-        sorted_records = sorted(
-            [r for r in self._data if r.get('ts')],
-            key=lambda x: datetime.fromisoformat(x['ts'].replace('Z', '+00:00'))
-        )
-
-        for record in sorted_records:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-
-            if current_session_start is None:
-                current_session_start = dt
-                current_session_end = dt
-            else:
-                # Check if this is same session (<30min gap)
-                gap = (dt - current_session_end).total_seconds() / 60
-                if gap <= 30:
-                    current_session_end = dt
-                else:
-                    # Save previous session and start new one
-                    duration_mins = (current_session_end - current_session_start).total_seconds() / 60
-                    sessions.append(duration_mins)
-                    current_session_start = dt
-                    current_session_end = dt
-
-        # Don't forget last session
-        if current_session_start and current_session_end:
-            duration_mins = (current_session_end - current_session_start).total_seconds() / 60
-            sessions.append(duration_mins)
+        _, sorted_ts = self._chronological_order()
+        starts, stops = self._session_bounds()
+        seconds = sorted_ts.astype(np.int64)
+        sessions = seconds[stops - 1] - seconds[starts]  # Durations in seconds
 
         # Group into buckets for distribution
-        buckets = defaultdict(int)
-        for duration in sessions:
-            if duration < 15:
-                buckets['0-15'] += 1
-            elif duration < 30:
-                buckets['15-30'] += 1
-            elif duration < 60:
-                buckets['30-60'] += 1
-            elif duration < 120:
-                buckets['60-120'] += 1
-            elif duration < 180:
-                buckets['120-180'] += 1
-            else:
-                buckets['180+'] += 1
+        bucket_edges = np.array([15, 30, 60, 120, 180]) * 60
+        buckets = np.bincount(
+            np.searchsorted(bucket_edges, sessions, side='right'),
+            minlength=len(bucket_edges) + 1
+        )
 
         bucket_order = ['0-15', '15-30', '30-60', '60-120', '120-180', '180+']
         result = [
-            {'duration_range': bucket, 'session_count': buckets.get(bucket, 0)}
-            for bucket in bucket_order
+            {'duration_range': bucket, 'session_count': count}
+            for bucket, count in zip(bucket_order, buckets.tolist())
         ]
 
         return result
 
+    @_memoized
     def get_binge_sessions(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Get top binge sessions (longest continuous listening periods)
@@ -898,64 +1164,30 @@ class SpotifyDataLoader:
             self.load_data()
 
         # Group streams into sessions (30min gap threshold)
-        sessions = []
-        current_session = {
-            'start': None,
-            'end': None,
-            'tracks': 0
-        }
-
-        sorted_records = sorted(
-            [r for r in self._data if r.get('ts')],
-            key=lambda x: datetime.fromisoformat(x['ts'].replace('Z', '+00:00'))
-        )
-
-        for record in sorted_records:
-            ts = record.get('ts')
-            if not ts:
-                continue
+        _, sorted_ts = self._chronological_order()
+        starts, stops = self._session_bounds()
+        seconds = sorted_ts.astype(np.int64)
 
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-
-            if current_session['start'] is None:
-                current_session['start'] = dt
-                current_session['end'] = dt
-                current_session['tracks'] = 1
-            else:
-                gap = (dt - current_session['end']).total_seconds() / 60
-                if gap <= 30:
-                    current_session['end'] = dt
-                    current_session['tracks'] += 1
-                else:
-                    # Save and start new
-                    sessions.append(current_session.copy())
-                    current_session = {
-                        'start': dt,
-                        'end': dt,
-                        'tracks': 1
-                    }
-
-        # Don't forget last session
-        if current_session['start']:
-            sessions.append(current_session)
-
-        # Calculate durations and sort
-        for session in sessions:
-            duration = (session['end'] - session['start']).total_seconds() / 60
-            session['duration_minutes'] = round(duration, 1)
-            session['session_date'] = session['start'].strftime('%Y-%m-%d %H:%M')
-
-        sessions.sort(key=lambda x: x['duration_minutes'], reverse=True)
+        # Calculate durations and sort, ties kept in chronological order
+        durations = np.array([
+            round(duration / 60, 1) for duration in (seconds[stops - 1] - seconds[starts]).tolist()
+        ])
+        longest = np.argsort(-durations, kind='stable')[:limit]
 
         return [
             {
-                'session_date': s['session_date'],
-                'duration_minutes': s['duration_minutes'],
-                'track_count': s['tracks']
+                'session_date': start.strftime('%Y-%m-%d %H:%M'),
+                'duration_minutes': duration,
+                'track_count': tracks
             }
-            for s in sessions[:limit]
+            for start, duration, tracks in zip(
+                sorted_ts[starts[longest]].astype(object),
+                durations[longest].tolist(),
+                (stops - starts)[longest].tolist(),
+            )
         ]
 
+    @_memoized
     def get_session_statistics(self) -> Dict[str, Any]:
         """
         Get aggregate session statistics
@@ -966,47 +1198,23 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        sessions = []
-        current_session = {'start': None, 'end': None, 'tracks': 0}
-
-        sorted_records = sorted(
-            [r for r in self._data if r.get('ts')],
-            key=lambda x: datetime.fromisoformat(x['ts'].replace('Z', '+00:00'))
-        )
-
-        for record in sorted_records:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-
-            if current_session['start'] is None:
-                current_session = {'start': dt, 'end': dt, 'tracks': 1}
-            else:
-                gap = (dt - current_session['end']).total_seconds() / 60
-                if gap <= 30:
-                    current_session['end'] = dt
-                    current_session['tracks'] += 1
-                else:
-                    sessions.append(current_session.copy())
-                    current_session = {'start': dt, 'end': dt, 'tracks': 1}
-
-        if current_session['start']:
-            sessions.append(current_session)
+        _, sorted_ts = self._chronological_order()
+        starts, stops = self._session_bounds()
+        seconds = sorted_ts.astype(np.int64)
 
         # Calculate stats
-        durations = [(s['end'] - s['start']).total_seconds() / 60 for s in sessions]
-        track_counts = [s['tracks'] for s in sessions]
+        durations = ((seconds[stops - 1] - seconds[starts]) / 60).tolist()
+        track_counts = (stops - starts).tolist()
 
         return {
-            'total_sessions': len(sessions),
-            'avg_duration_minutes': round(statistics.mean(durations), 1) if durations else 0,
+            'total_sessions': len(durations),
+            'avg_duration_minutes': round(_mean(durations), 1) if durations else 0,
             'median_duration_minutes': round(statistics.median(durations), 1) if durations else 0,
-            'avg_tracks_per_session': round(statistics.mean(track_counts), 1) if track_counts else 0,
+            'avg_tracks_per_session': round(_mean(track_counts), 1) if track_counts else 0,
             'longest_session_minutes': round(max(durations), 1) if durations else 0,
         }
 
+    @_memoized
     def get_weekend_weekday_comparison(self) -> Dict[str, Any]:
         """
         Detailed weekend vs weekday listening comparison
@@ -1017,26 +1225,12 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        weekday_streams = 0
-        weekend_streams = 0
-        weekday_hours = 0.0
-        weekend_hours = 0.0
-
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
+        is_weekend = WEEKEND_DAYS[self._weekday]
+        streams = np.bincount(is_weekend, minlength=2)
+        ms_played = np.bincount(is_weekend, weights=self._ms_played, minlength=2)
 
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            is_weekend = dt.weekday() >= 5
-            hours = record.get('ms_played', 0) / 3_600_000
-
-            if is_weekend:
-                weekend_streams += 1
-                weekend_hours += hours
-            else:
-                weekday_streams += 1
-                weekday_hours += hours
+        weekday_streams, weekend_streams = streams.tolist()
+        weekday_hours, weekend_hours = (ms_played / 3_600_000).tolist()
 
         return {
             'weekday': {
@@ -1051,6 +1245,7 @@ class SpotifyDataLoader:
             }
         }
 
+    @_memoized
     def get_listening_streaks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get consecutive day listening streaks
@@ -1061,60 +1256,34 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        # Get unique dates with stream counts
-        daily_streams = defaultdict(int)
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            daily_streams[dt.date()] += 1
-
-        if not daily_streams:
+        # Get unique dates with stream counts, grouped into consecutive runs
+        days, daily_streams, starts, stops = self._day_runs()
+        if not len(days):
             return []
 
-        # Find streaks
-        sorted_dates = sorted(daily_streams.keys())
-        streaks = []
-        current_streak = {
-            'start': sorted_dates[0],
-            'end': sorted_dates[0],
-            'streams': daily_streams[sorted_dates[0]]
-        }
-
-        for i in range(1, len(sorted_dates)):
-            if (sorted_dates[i] - sorted_dates[i-1]).days == 1:
-                # Continue streak
-                current_streak['end'] = sorted_dates[i]
-                current_streak['streams'] += daily_streams[sorted_dates[i]]
-            else:
-                # End streak, save and start new
-                if (current_streak['end'] - current_streak['start']).days >= 2:
-                    streaks.append(current_streak.copy())
-                current_streak = {
-                    'start': sorted_dates[i],
-                    'end': sorted_dates[i],
-                    'streams': daily_streams[sorted_dates[i]]
-                }
-
-        # Don't forget last streak
-        if (current_streak['end'] - current_streak['start']).days >= 2:
-            streaks.append(current_streak)
-
-        # Sort by length
-        for streak in streaks:
-            streak['length_days'] = (streak['end'] - streak['start']).days + 1
-            streak['start_date'] = streak['start'].isoformat()
-            streak['end_date'] = streak['end'].isoformat()
-            streak['total_streams'] = streak['streams']
-            del streak['start']
-            del streak['end']
-            del streak['streams']
+        lengths = stops - starts  # Runs are consecutive days
+        streams = np.add.reduceat(daily_streams, starts)
 
-        streaks.sort(key=lambda x: x['length_days'], reverse=True)
+        # Keep streaks of 3+ days, longest first, ties in date order
+        streaks = np.flatnonzero(lengths >= 3)
+        streaks = streaks[np.argsort(-lengths[streaks], kind='stable')][:limit]
 
-        return streaks[:limit]
+        return [
+            {
+                'length_days': length,
+                'start_date': start,
+                'end_date': end,
+                'total_streams': total
+            }
+            for length, start, end, total in zip(
+                lengths[streaks].tolist(),
+                np.datetime_as_string(days[starts[streaks]]).tolist(),
+                np.datetime_as_string(days[stops[streaks] - 1]).tolist(),
+                streams[streaks].tolist(),
+            )
+        ]
 
+    @_memoized
     def get_most_repeated_tracks(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Get tracks played most frequently (on repeat)
@@ -1125,43 +1294,38 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        track_plays = defaultdict(lambda: {'count': 0, 'dates': set(), 'artist': None})
-
-        for record in self._data:
-            track = record.get('master_metadata_track_name')
-            artist = record.get('master_metadata_album_artist_name')
-            ts = record.get('ts')
-
-            if not track or not artist or not ts:
-                continue
-
-            key = f"{track}|||{artist}"
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+        # Plays per (track, artist), pairs in order of first appearance
+        present, pair_idx, pairs = self._track_pairs()
+        play_counts = np.bincount(pair_idx, minlength=len(pairs))
 
-            track_plays[key]['count'] += 1
-            track_plays[key]['dates'].add(dt.date())
-            track_plays[key]['artist'] = artist
+        # Distinct days per pair from the unique (pair, day) combinations
+        day_idx, days = pd.factorize(self._day[present].astype(np.int64))
+        pair_days = np.unique(pair_idx.astype(np.int64) * len(days) + day_idx)
+        day_counts = np.bincount(pair_days // len(days), minlength=len(pairs))
 
         # Calculate repeat score (plays per unique day)
-        results = []
-        for key, data in track_plays.items():
-            if data['count'] < 5:  # Minimum threshold
-                continue
-
-            repeat_score = data['count'] / len(data['dates'])
-            track_name = key.split('|||')[0]
+        eligible = np.flatnonzero(play_counts >= 5)  # Minimum threshold
+        repeat_scores = np.array([
+            round(count / n_days, 2)
+            for count, n_days in zip(play_counts[eligible].tolist(), day_counts[eligible].tolist())
+        ])
+        ranked = np.argsort(-repeat_scores, kind='stable')[:limit]
+        top = eligible[ranked]
+        tracks, artists = np.divmod(pairs[top], len(self._artist_names))
 
-            results.append({
-                'track': track_name,
-                'artist': data['artist'],
-                'play_count': data['count'],
-                'repeat_score': round(repeat_score, 2)
-            })
-
-        results.sort(key=lambda x: x['repeat_score'], reverse=True)
-
-        return results[:limit]
+        return [
+            {
+                'track': self._track_names[track],
+                'artist': self._artist_names[artist],
+                'play_count': count,
+                'repeat_score': score
+            }
+            for track, artist, count, score in zip(
+                tracks.tolist(), artists.tolist(), play_counts[top].tolist(), repeat_scores[ranked].tolist()
+            )
+        ]
 
+    @_memoized
     def get_monthly_diversity(self) -> List[Dict[str, Any]]:
         """
         Get artist diversity over time (unique artists per month)
@@ -1172,34 +1336,30 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        monthly_artists = defaultdict(set)
-        monthly_streams = defaultdict(int)
-
-        for record in self._data:
-            ts = record.get('ts')
-            artist = record.get('master_metadata_album_artist_name')
-
-            if not ts or not artist:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            month_key = dt.strftime('%Y-%m')
+        # Only streams with an artist count towards diversity
+        months, month_idx = self._month_groups()
+        present = self._artist_codes >= 0
+        month_idx = month_idx[present]
+        n_artists = len(self._artist_names)
 
-            monthly_artists[month_key].add(artist)
-            monthly_streams[month_key] += 1
+        monthly_streams = np.bincount(month_idx, minlength=len(months))
+        month_artists = np.unique(month_idx.astype(np.int64) * n_artists + self._artist_codes[present])
+        monthly_artists = np.bincount(month_artists // n_artists, minlength=len(months))
+        month_labels = np.datetime_as_string(months, unit='M').tolist()
 
         result = [
             {
-                'month': month,
-                'unique_artists': len(artists),
-                'total_streams': monthly_streams[month],
-                'diversity_ratio': round(len(artists) / monthly_streams[month] * 100, 2) if monthly_streams[month] > 0 else 0
+                'month': month_labels[i],
+                'unique_artists': int(monthly_artists[i]),
+                'total_streams': int(monthly_streams[i]),
+                'diversity_ratio': round(int(monthly_artists[i]) / int(monthly_streams[i]) * 100, 2)
             }
-            for month, artists in sorted(monthly_artists.items())
+            for i in np.flatnonzero(monthly_streams).tolist()
         ]
 
         return result
 
+    @_memoized
     def get_listening_heatmap(self) -> List[Dict[str, Any]]:
         """
         Get day-hour heatmap data
@@ -1210,19 +1370,11 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        heatmap_data = defaultdict(int)
-
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            day = dt.weekday()  # 0=Monday, 6=Sunday
-            hour = dt.hour
-
-            key = (day, hour)
-            heatmap_data[key] += 1
+        # Flat day-hour cells, 0=Monday 00:00 ... 167=Sunday 23:00
+        heatmap_data = np.bincount(
+            self._weekday.astype(np.intp) * 24 + self._hour,
+            minlength=7 * 24
+        ).reshape(7, 24)
 
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
@@ -1230,7 +1382,7 @@ class SpotifyDataLoader:
             {
                 'day': day_names[day],
                 'hour': hour,
-                'stream_count': heatmap_data.get((day, hour), 0)
+                'stream_count': int(heatmap_data[day, hour])
             }
             for day in range(7)
             for hour in range(24)
@@ -1248,62 +1400,16 @@ class SpotifyDataLoader:
         if not self._loaded:
             self.load_data()
 
-        # Sort records by timestamp
-        sorted_records = sorted(
-            [r for r in self._data if r.get('ts')],
-            key=lambda x: datetime.fromisoformat(x['ts'].replace('Z', '+00:00'))
-        )
-
-        if not sorted_records:
-            return []
-
-        sessions = []
-        current_session = {
-            'records': [],
-            'start_time': None,
-            'end_time': None
-        }
-
-        for record in sorted_records:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-
-            if current_session['start_time'] is None:
-                # Start new session
-                current_session['start_time'] = dt
-                current_session['end_time'] = dt
-                current_session['records'] = [record]
-            else:
-                # Check if this record belongs to current session (30-min gap)
-                gap_minutes = (dt - current_session['end_time']).total_seconds() / 60
-
-                if gap_minutes <= 30:
-                    # Add to current session
-                    current_session['end_time'] = dt
-                    current_session['records'].append(record)
-                else:
-                    # Save current session and start new one
-                    if len(current_session['records']) >= 3:  # Only save sessions with 3+ tracks
-                        sessions.append(self._extract_session_features(current_session))
-
-                    current_session = {
-                        'start_time': dt,
-                        'end_time': dt,
-                        'records': [record]
-                    }
+        starts, stops = self._session_bounds()
 
-        # Don't forget last session
-        if current_session['start_time'] and len(current_session['records']) >= 3:
-            sessions.append(self._extract_session_features(current_session))
+        # Only keep sessions with 3+ tracks
+        keep = stops - starts >= 3
 
-        return sessions
+        return self._extract_session_features(starts[keep], stops[keep])
 
-    def _extract_session_features(self, session: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_session_features(self, starts: np.ndarray, stops: np.ndarray) -> List[Dict[str, Any]]:
         """
-        Extract features from a session for clustering
+        Extract features for a batch of sessions for clustering
 
         Features:
         - duration_minutes: Total session duration
@@ -1314,59 +1420,97 @@ class SpotifyDataLoader:
         - hour_of_day: Hour when session started (0-23)
         - is_weekend: Whether session was on weekend
         - diversity_score: Unique artists / total tracks
+
+        Args:
+            starts, stops: Each session's span in the chronological order, stop exclusive
         """
-        records = session['records']
-        start_time = session['start_time']
-        end_time = session['end_time']
+        order, sorted_ts = self._chronological_order()
+        n_sessions = len(starts)
+        first_rows = order[starts]
+        start_times = np.datetime_as_string(sorted_ts[starts], unit='s').tolist()
+        end_times = np.datetime_as_string(sorted_ts[stops - 1], unit='s').tolist()
+
+        # Every stream of the sessions, grouped by session in time order
+        lengths = stops - starts
+        session_idx = np.repeat(np.arange(n_sessions), lengths)
+        session_offsets = np.arange(len(session_idx)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        rows = order[starts[session_idx] + session_offsets]
 
         # Basic metrics
-        duration_minutes = (end_time - start_time).total_seconds() / 60
-        track_count = len(records)
+        seconds = sorted_ts.astype(np.int64)
+        duration_minutes = ((seconds[stops - 1] - seconds[starts]) / 60).tolist()
+        track_counts = lengths.tolist()
 
         # Artist diversity
-        artists = set()
-        for r in records:
-            artist = r.get('master_metadata_album_artist_name')
-            if artist:
-                artists.add(artist)
-        unique_artists_count = len(artists)
+        n_artists = len(self._artist_names)
+        artists = self._artist_codes[rows]
+        named = artists >= 0
+        session_artists = np.unique(session_idx[named].astype(np.int64) * n_artists + artists[named])
+        unique_artists = np.bincount(session_artists // n_artists, minlength=n_sessions).tolist()
 
         # Skip ratio
-        skipped_count = sum(1 for r in records if r.get('skipped', False))
-        skip_ratio = (skipped_count / track_count * 100) if track_count > 0 else 0
+        skipped_counts = np.bincount(session_idx[self._skipped[rows]], minlength=n_sessions).tolist()
 
-        # Average track duration (in minutes)
-        track_durations = [r.get('ms_played', 0) / 60000 for r in records]
-        avg_track_duration = statistics.mean(track_durations) if track_durations else 0
+        # Average track duration (in minutes), each session summed exactly like _mean
+        track_minutes = (self._ms_played[rows] / 60000).tolist()
+        bounds = np.concatenate(([0], np.cumsum(track_counts))).tolist()
+        avg_track_durations = [
+            _mean(track_minutes[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])
+        ]
 
         # Time features
-        hour_of_day = start_time.hour
-        is_weekend = 1 if start_time.weekday() >= 5 else 0
+        hours = self._hour[first_rows].tolist()
+        weekends = WEEKEND_DAYS[self._weekday[first_rows]].astype(int).tolist()
+
+        # Platform; ties go to the one played first in the session
+        n_platforms = len(self._platform_names) + 1
+        platform_keys, first_plays, plays = np.unique(
+            session_idx.astype(np.int64) * n_platforms + self._platform_codes[rows] + 1,
+            return_index=True,
+            return_counts=True
+        )
+        platform_sessions = platform_keys // n_platforms
+        ranked = np.lexsort((first_plays, -plays, platform_sessions))
+        is_top = np.concatenate(([True], np.diff(platform_sessions[ranked]) != 0)) if len(ranked) else ranked
+        platform_labels = np.append(self._platform_names, 'unknown')  # Code -1 wraps to 'unknown'
+        platforms = platform_labels[platform_keys[ranked[is_top]] % n_platforms - 1].tolist()
 
-        # Diversity score
-        diversity_score = (unique_artists_count / track_count) if track_count > 0 else 0
+        return [
+            {
+                'session_id': f"{start_time}+00:00",
+                'start_time': f"{start_time}+00:00",
+                'end_time': f"{end_time}+00:00",
+                'duration_minutes': round(duration, 2),
+                'track_count': track_count,
+                'unique_artists_count': n_unique,
+                'skip_ratio': round(skipped / track_count * 100, 2),
+                'avg_track_duration': round(avg_track_duration, 2),
+                'hour_of_day': hour,
+                'is_weekend': is_weekend,
+                'diversity_score': round(n_unique / track_count, 3),
+                'platform': platform
+            }
+            for (
+                start_time, end_time, duration, track_count, n_unique,
+                skipped, avg_track_duration, hour, is_weekend, platform
+            ) in zip(
+                start_times, end_times, duration_minutes, track_counts, unique_artists,
+                skipped_counts, avg_track_durations, hours, weekends, platforms
+            )
+        ]
 
-        # Platform
-        platforms = [r.get('platform', 'unknown') for r in records]
-        most_common_platform = max(set(platforms), key=platforms.count) if platforms else 'unknown'
+    def _cluster_sessions(self) -> Dict[str, Any]:
+        """
+        Session clustering shared by the clusters, centroids and assignments endpoints.
 
-        return {
-            'session_id': f"{start_time.isoformat()}",
-            'start_time': start_time.isoformat(),
-            'end_time': end_time.isoformat(),
-            'duration_minutes': round(duration_minutes, 2),
-            'track_count': track_count,
-            'unique_artists_count': unique_artists_count,
-            'skip_ratio': round(skip_ratio, 2),
-            'avg_track_duration': round(avg_track_duration, 2),
-            'hour_of_day': hour_of_day,
-            'is_weekend': is_weekend,
-            'diversity_score': round(diversity_score, 3),
-            'platform': most_common_platform,
-            'records': records  # Keep for later analysis if needed
-        }
+        The frontend requests all three at once, so concurrent first calls
+        wait for a single fit and then read its cached result.
+        """
+        with self._cluster_lock:
+            return self._fit_session_clusters()
 
-    def _cluster_sessions(self) -> Dict[str, Any]:
+    @_memoized
+    def _fit_session_clusters(self) -> Dict[str, Any]:
         """
         Cluster sessions using k-means with optimal k selection via silhouette score
 
@@ -1385,6 +1529,11 @@ class SpotifyDataLoader:
                 'error': 'Not enough sessions for clustering'
             }
 
+        # sklearn takes over a second to import; only pay for it when clustering
+        from sklearn.cluster import KMeans
+        from sklearn.metrics import silhouette_score
+        from sklearn.preprocessing import StandardScaler
+
         # Extract features for clustering
         feature_names = [
             'duration_minutes',
@@ -1441,6 +1590,7 @@ class SpotifyDataLoader:
             'silhouette_score': round(best_score, 3)
         }
 
+    @_memoized
     def get_session_clusters(self) -> Dict[str, Any]:
         """
         Get cluster statistics and profiles
@@ -1468,11 +1618,11 @@ class SpotifyDataLoader:
             clusters.append({
                 'cluster_id': cluster_id,
                 'session_count': len(cluster_sessions),
-                'avg_duration': round(statistics.mean([s['duration_minutes'] for s in cluster_sessions]), 1),
-                'avg_tracks': round(statistics.mean([s['track_count'] for s in cluster_sessions]), 1),
-                'avg_skip_ratio': round(statistics.mean([s['skip_ratio'] for s in cluster_sessions]), 1),
-                'avg_diversity': round(statistics.mean([s['diversity_score'] for s in cluster_sessions]), 2),
-                'common_hour': round(statistics.mean([s['hour_of_day'] for s in cluster_sessions])),
+                'avg_duration': round(_mean([s['duration_minutes'] for s in cluster_sessions]), 1),
+                'avg_tracks': round(_mean([s['track_count'] for s in cluster_sessions]), 1),
+                'avg_skip_ratio': round(_mean([s['skip_ratio'] for s in cluster_sessions]), 1),
+                'avg_diversity': round(_mean([s['diversity_score'] for s in cluster_sessions]), 2),
+                'common_hour': round(_mean([s['hour_of_day'] for s in cluster_sessions])),
                 'weekend_ratio': round(sum([s['is_weekend'] for s in cluster_sessions]) / len(cluster_sessions) * 100, 1)
             })
 
@@ -1483,6 +1633,7 @@ class SpotifyDataLoader:
             'clusters': clusters
         }
 
+    @_memoized
     def get_session_centroids(self) -> List[Dict[str, Any]]:
         """
         Get cluster centroids with feature values
@@ -1510,6 +1661,7 @@ class SpotifyDataLoader:
 
         return result
 
+    @_memoized
     def get_session_assignments(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Get recent sessions with their cluster assignments
@@ -1528,18 +1680,9 @@ class SpotifyDataLoader:
         sessions = clustering_result['sessions']
 
         # Sort by start time (most recent first) and limit
-        sessions_sorted = sorted(sessions, key=lambda x: x['start_time'], reverse=True)[:limit]
-
-        # Remove 'records' field for cleaner response
-        result = []
-        for session in sessions_sorted:
-            session_copy = session.copy()
-            if 'records' in session_copy:
-                del session_copy['records']
-            result.append(session_copy)
-
-        return result
+        return heapq.nlargest(limit, sessions, key=lambda x: x['start_time'])
 
+    @_memoized
     def get_milestones_list(self) -> List[Dict[str, Any]]:
         """
         Get all milestones - streaks, top days, firsts, and notable achievements
@@ -1552,74 +1695,26 @@ class SpotifyDataLoader:
 
         milestones = []
 
-        # Track daily streams and dates
-        daily_streams = defaultdict(int)
-        daily_hours = defaultdict(float)
-        daily_tracks = defaultdict(set)
-        daily_artists = defaultdict(set)
-        artist_first_seen = {}
-        track_first_seen = {}
-
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            date_key = dt.date()
-
-            daily_streams[date_key] += 1
-            daily_hours[date_key] += record.get('ms_played', 0) / 3_600_000
-
-            track = record.get('master_metadata_track_name')
-            artist = record.get('master_metadata_album_artist_name')
-
-            if track and artist:
-                daily_tracks[date_key].add(f"{track}|||{artist}")
-                daily_artists[date_key].add(artist)
-
-                # Track firsts
-                if artist not in artist_first_seen:
-                    artist_first_seen[artist] = dt
-
-                if track not in track_first_seen:
-                    track_first_seen[track] = (dt, artist)
-
-        if not daily_streams:
+        if not len(self._day):
             return []
 
+        # Daily streams and hours, days in order of first appearance
+        day_idx, days = pd.factorize(self._day.astype(np.int64))
+        days = days.astype('datetime64[D]')
+        daily_streams = np.bincount(day_idx, minlength=len(days))
+        daily_ms = np.bincount(day_idx, weights=self._ms_played, minlength=len(days))
+
         # 1. Find listening streaks (3+ consecutive days)
-        sorted_dates = sorted(daily_streams.keys())
-        current_streak_start = sorted_dates[0]
-        current_streak_end = sorted_dates[0]
-        streaks = []
-
-        for i in range(1, len(sorted_dates)):
-            if (sorted_dates[i] - sorted_dates[i-1]).days == 1:
-                current_streak_end = sorted_dates[i]
-            else:
-                # End streak
-                streak_length = (current_streak_end - current_streak_start).days + 1
-                if streak_length >= 3:  # Only save streaks of 3+ days
-                    streaks.append({
-                        'start': current_streak_start,
-                        'end': current_streak_end,
-                        'length': streak_length
-                    })
-                current_streak_start = sorted_dates[i]
-                current_streak_end = sorted_dates[i]
-
-        # Don't forget last streak
-        streak_length = (current_streak_end - current_streak_start).days + 1
-        if streak_length >= 3:
-            streaks.append({
-                'start': current_streak_start,
-                'end': current_streak_end,
-                'length': streak_length
-            })
+        sorted_dates, _, run_starts, run_stops = self._day_runs()
+        run_starts, run_ends = sorted_dates[run_starts], sorted_dates[run_stops - 1]
+        streaks = [
+            {'start': start, 'end': end, 'length': (end - start).days + 1}
+            for start, end in zip(run_starts.astype(object), run_ends.astype(object))
+            if (end - start).days + 1 >= 3  # Only save streaks of 3+ days
+        ]
 
         # Add streak milestones
-        for streak in sorted(streaks, key=lambda x: x['length'], reverse=True)[:10]:
+        for streak in heapq.nlargest(10, streaks, key=lambda x: x['length']):
             milestones.append({
                 'date': streak['start'].isoformat(),
                 'year': streak['start'].year,
@@ -1631,24 +1726,36 @@ class SpotifyDataLoader:
             })
 
         # 2. Top listening days
-        top_days = sorted(daily_streams.items(), key=lambda x: x[1], reverse=True)[:15]
-        for date, count in top_days:
+        top_days = np.argsort(-daily_streams, kind='stable')[:15]
+        for day in top_days.tolist():
+            date = days[day].astype(object)
+            count = int(daily_streams[day])
             if count >= 50:  # Only notable days
                 milestones.append({
                     'date': date.isoformat(),
                     'year': date.year,
                     'type': 'top_day',
                     'title': f"{count} Streams in One Day",
-                    'description': f"Peak listening day on {date.strftime('%b %d, %Y')} with {round(daily_hours[date], 1)} hours",
+                    'description': f"Peak listening day on {date.strftime('%b %d, %Y')} with {round(daily_ms[day] / 3_600_000, 1)} hours",
                     'value': count,
                     'badge_color': '#4ea699'
                 })
 
+        # Firsts and diversity only count streams with both a track and an artist
+        named, _, _ = self._track_pairs()
+        named_artists = self._artist_codes[named]
+
         # 3. First discoveries (notable artists)
         top_artists = self.get_top_artists(limit=20)
         top_artist_names = {a['artist'] for a in top_artists}
 
-        for artist, first_date in sorted(artist_first_seen.items(), key=lambda x: x[1])[:20]:
+        # First stream of each artist; earliest first, ties by order of appearance
+        artist_codes, first_rows = np.unique(named_artists, return_index=True)
+        first_seen = self._ts[named][first_rows]
+        earliest = np.lexsort((first_rows, first_seen))[:20]
+
+        for artist_code, first_date in zip(artist_codes[earliest].tolist(), first_seen[earliest].astype(object)):
+            artist = self._artist_names[artist_code]
             if artist in top_artist_names:
                 milestones.append({
                     'date': first_date.date().isoformat(),
@@ -1661,16 +1768,23 @@ class SpotifyDataLoader:
                 })
 
         # 4. Diversity milestones (days with many unique artists)
-        diverse_days = sorted(daily_artists.items(), key=lambda x: len(x[1]), reverse=True)[:10]
-        for date, artists in diverse_days:
-            if len(artists) >= 20:  # Only notable diversity
+        named_day_idx, named_days = pd.factorize(self._day[named].astype(np.int64))
+        named_days = named_days.astype('datetime64[D]')
+        day_artists = pd.unique(named_day_idx.astype(np.int64) * len(self._artist_names) + named_artists)
+        daily_artist_counts = np.bincount(day_artists // len(self._artist_names), minlength=len(named_days))
+
+        diverse_days = np.argsort(-daily_artist_counts, kind='stable')[:10]
+        for day in diverse_days.tolist():
+            date = named_days[day].astype(object)
+            artist_count = int(daily_artist_counts[day])
+            if artist_count >= 20:  # Only notable diversity
                 milestones.append({
                     'date': date.isoformat(),
                     'year': date.year,
                     'type': 'diversity',
-                    'title': f"{len(artists)} Different Artists",
-                    'description': f"Explored {len(artists)} artists on {date.strftime('%b %d, %Y')}",
-                    'value': len(artists),
+                    'title': f"{artist_count} Different Artists",
+                    'description': f"Explored {artist_count} artists on {date.strftime('%b %d, %Y')}",
+                    'value': artist_count,
                     'badge_color': '#140d4f'
                 })
 
@@ -1701,79 +1815,65 @@ class SpotifyDataLoader:
             }
 
         # Collect all streams for this date
-        day_streams = []
-        artists_played = defaultdict(int)
-        tracks_played = defaultdict(lambda: {'count': 0, 'artist': None})
-        total_hours = 0
-        skipped_count = 0
-
-        for record in self._data:
-            ts = record.get('ts')
-            if not ts:
-                continue
-
-            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            if dt.date() != target_date:
-                continue
-
-            day_streams.append(record)
-            total_hours += record.get('ms_played', 0) / 3_600_000
-
-            if record.get('skipped'):
-                skipped_count += 1
+        day_start = np.datetime64(target_date, 'D')
+        order, sorted_ts = self._chronological_order()
+        start, end = np.searchsorted(sorted_ts, [day_start, day_start + 1])
+        day_rows = np.sort(order[start:end])  # Back to file order
 
-            artist = record.get('master_metadata_album_artist_name')
-            track = record.get('master_metadata_track_name')
-
-            if artist:
-                artists_played[artist] += 1
-
-            if track and artist:
-                tracks_played[track]['count'] += 1
-                tracks_played[track]['artist'] = artist
-
-        if not day_streams:
+        if not len(day_rows):
             return {
                 'date': date_str,
                 'streams': 0,
                 'message': 'No listening data found for this date'
             }
 
-        # Get top artists and tracks for that day
-        top_artists_day = sorted(artists_played.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_tracks_day = sorted(
-            [(track, data) for track, data in tracks_played.items()],
-            key=lambda x: x[1]['count'],
-            reverse=True
-        )[:5]
+        # Artists by streams, ties in order of first play that day
+        named_rows = day_rows[self._artist_codes[day_rows] >= 0]
+        artist_idx, day_artists = pd.factorize(self._artist_codes[named_rows])
+        artist_counts = np.bincount(artist_idx, minlength=len(day_artists))
+        top_artists_day = np.argsort(-artist_counts, kind='stable')[:5]
+
+        # Tracks are keyed by name and credited to the artist of their last play
+        track_rows = named_rows[self._track_codes[named_rows] >= 0]
+        track_idx, day_tracks = pd.factorize(self._track_codes[track_rows])
+        track_counts = np.bincount(track_idx, minlength=len(day_tracks))
+        last_plays = np.zeros(len(day_tracks), dtype=np.intp)
+        np.maximum.at(last_plays, track_idx, np.arange(len(track_rows)))
+        track_artists = self._artist_codes[track_rows][last_plays]
+        top_tracks_day = np.argsort(-track_counts, kind='stable')[:5]
+
+        streams = len(day_rows)
+        total_hours = int(self._ms_played[day_rows].sum()) / 3_600_000
+        skipped_count = int(np.count_nonzero(self._skipped[day_rows]))
 
         # Get first and last stream times
-        timestamps = [
-            datetime.fromisoformat(r.get('ts').replace('Z', '+00:00'))
-            for r in day_streams if r.get('ts')
-        ]
-        first_stream = min(timestamps) if timestamps else None
-        last_stream = max(timestamps) if timestamps else None
+        timestamps = self._ts[day_rows]
+        first_stream = timestamps.min().astype(datetime)
+        last_stream = timestamps.max().astype(datetime)
 
         return {
             'date': date_str,
             'day_of_week': target_date.strftime('%A'),
-            'streams': len(day_streams),
+            'streams': streams,
             'hours': round(total_hours, 2),
-            'unique_artists': len(artists_played),
-            'unique_tracks': len(tracks_played),
+            'unique_artists': len(day_artists),
+            'unique_tracks': len(day_tracks),
             'skipped': skipped_count,
-            'skip_rate': round((skipped_count / len(day_streams)) * 100, 1) if day_streams else 0,
+            'skip_rate': round((skipped_count / streams) * 100, 1),
             'first_stream': first_stream.strftime('%I:%M %p') if first_stream else None,
             'last_stream': last_stream.strftime('%I:%M %p') if last_stream else None,
             'listening_duration': f"{(last_stream - first_stream).total_seconds() / 3600:.1f} hours" if first_stream and last_stream else None,
             'top_artists': [
-                {'artist': artist, 'streams': count}
-                for artist, count in top_artists_day
+                {'artist': self._artist_names[day_artists[i]], 'streams': int(artist_counts[i])}
+                for i in top_artists_day.tolist()
             ],
             'top_tracks': [
-                {'track': track, 'artist': data['artist'], 'plays': data['count']}
-                for track, data in top_tracks_day
+                {
+                    'track': self._track_names[day_tracks[i]],
+                    'artist': self._artist_names[track_artists[i]],
+                    'plays': int(track_counts[i])
+                }
+                for i in top_tracks_day.tolist()
             ]
         }
 
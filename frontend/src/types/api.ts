@@ -33,7 +33,7 @@ export interface PlatformStat {
 // Phase 2 - Mood Types
 
 export interface MoodSummary {
-  window_days: number;
+  window_days: number | null;
   avg_valence: number | null;
   avg_energy: number | null;
   avg_danceability: number | null;